@@ -3,17 +3,18 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from typing import List
 
 from fastapi import Depends, FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.websockets import WebSocketDisconnect
 
 from .database import Base, engine, get_db
-from .models import Job, serialize_job
+from .models import Job, serialize_job_row
 from .notifier import Notifier
-from .poller import poll_once, start_poller
+from .poller import close_http_client, poll_once, start_poller
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("internship_tracker")
@@ -34,7 +35,11 @@ poller_task: asyncio.Task | None = None
 
 @app.on_event("startup")
 async def on_startup() -> None:
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # create_all skips tables that already exist, so backfill indexes added since.
+        for index in Job.__table__.indexes:
+            await conn.run_sync(index.create, checkfirst=True)
     global poller_task
     poller_task = asyncio.create_task(start_poller(notifier))
     logger.info("Internship Tracker backend started")
@@ -47,19 +52,21 @@ async def on_shutdown() -> None:
         poller_task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await poller_task
+    await close_http_client()
+    await engine.dispose()
     logger.info("Internship Tracker backend stopped")
 
 
-@app.get("/jobs")
-def get_jobs(limit: int = 50, db: Session = Depends(get_db)) -> List[dict]:
+@app.get("/jobs", response_class=ORJSONResponse)
+async def get_jobs(limit: int = 50, db: AsyncSession = Depends(get_db)) -> ORJSONResponse:
     limit = max(1, min(200, limit))
-    jobs = (
-        db.query(Job)
+    stmt = (
+        select(*Job.__table__.c)
         .order_by(Job.posted_at.desc().nullslast(), Job.created_at.desc())
         .limit(limit)
-        .all()
     )
-    return [serialize_job(job) for job in jobs]
+    rows = (await db.execute(stmt)).all()
+    return ORJSONResponse([serialize_job_row(row._mapping) for row in rows])
 
 
 @app.post("/poll")
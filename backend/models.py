@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
 
-from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint, func
+from sqlalchemy import Column, DateTime, Index, Integer, String, UniqueConstraint, func
 
 from .database import Base
 
@@ -29,15 +29,22 @@ class Job(Base):
         )
 
 
-def serialize_job(job: Job) -> Dict[str, Any]:
+# Matches the ORDER BY in GET /jobs so Postgres can walk the index instead of sorting the table.
+Index("ix_jobs_posted_created", Job.posted_at.desc().nullslast(), Job.created_at.desc())
+
+
+def serialize_job_row(row: Mapping[str, Any]) -> Dict[str, Any]:
+    """Serialize a Core result mapping (e.g. ``row._mapping``) without ORM attribute access."""
+    posted_at = row["posted_at"]
+    created_at = row["created_at"]
     return {
-        "id": job.id,
-        "title": job.title,
-        "company": job.company,
-        "location": job.location,
-        "url": job.url,
-        "posted_at": job.posted_at.isoformat() if job.posted_at is not None and isinstance(job.posted_at, datetime) else None,
-        "req_id": job.req_id,
-        "source": job.source,
-        "created_at": job.created_at.isoformat() if isinstance(job.created_at, datetime) else None,
+        "id": row["id"],
+        "title": row["title"],
+        "company": row["company"],
+        "location": row["location"],
+        "url": row["url"],
+        "posted_at": posted_at.isoformat() if isinstance(posted_at, datetime) else None,
+        "req_id": row["req_id"],
+        "source": row["source"],
+        "created_at": created_at.isoformat() if isinstance(created_at, datetime) else None,
     }
@@ -1,45 +1,87 @@
 import asyncio
+import contextlib
 import logging
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+import orjson
 from fastapi import WebSocket
 from starlette.websockets import WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
 
+# Messages a client may fall behind by before it is treated as stalled and dropped.
+OUTBOUND_QUEUE_SIZE = 256
+# Clients enqueued per scheduler turn when broadcasting to large audiences.
+BROADCAST_BATCH_SIZE = 64
+
 
 class Notifier:
     def __init__(self) -> None:
-        self._connections: List[WebSocket] = []
+        self._connections: Dict[WebSocket, Tuple["asyncio.Queue[str]", asyncio.Task]] = {}
         self._lock = asyncio.Lock()
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
+        queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        task = asyncio.create_task(self._writer(websocket, queue))
         async with self._lock:
-            self._connections.append(websocket)
+            self._connections[websocket] = (queue, task)
         logger.info("WebSocket connected: %s", websocket.client)
 
     async def disconnect(self, websocket: WebSocket) -> None:
         async with self._lock:
-            if websocket in self._connections:
-                self._connections.remove(websocket)
+            entry = self._connections.pop(websocket, None)
+        if entry is not None:
+            _, writer = entry
+            if writer is not asyncio.current_task():
+                writer.cancel()
         logger.info("WebSocket disconnected: %s", websocket.client)
 
+    async def _writer(self, websocket: WebSocket, queue: "asyncio.Queue[str]") -> None:
+        try:
+            while True:
+                message = await queue.get()
+                await websocket.send_text(message)
+        except WebSocketDisconnect:
+            pass
+        except RuntimeError as exc:  # pragma: no cover - safety net for concurrent sends
+            logger.warning("Runtime error when pushing to websocket %s: %s", websocket.client, exc)
+        except Exception as exc:  # pragma: no cover - unexpected send failure
+            logger.exception("Failed to send payload to websocket %s", websocket.client, exc_info=exc)
+        await self.disconnect(websocket)
+
+    async def _evict(self, websocket: WebSocket) -> None:
+        await self.disconnect(websocket)
+        with contextlib.suppress(Exception):
+            await websocket.close(code=1013)
+
     async def broadcast(self, payload: Dict) -> None:
+        # Encode once for all clients; text frames keep JSON.parse working in the browser.
+        message = orjson.dumps(payload).decode()
         async with self._lock:
-            connections = list(self._connections)
-
-        for websocket in connections:
-            try:
-                await websocket.send_json(payload)
-            except WebSocketDisconnect:
-                await self.disconnect(websocket)
-            except RuntimeError as exc:  # pragma: no cover - safety net for concurrent sends
-                logger.warning("Runtime error when pushing to websocket %s: %s", websocket.client, exc)
-                await self.disconnect(websocket)
-            except Exception as exc:  # pragma: no cover - unexpected send failure
-                logger.exception("Failed to send payload to websocket %s", websocket.client, exc_info=exc)
-                await self.disconnect(websocket)
+            connections = list(self._connections.items())
+
+        # Each client drains its own queue, so a slow socket only ever backs up itself.
+        stalled: List[WebSocket] = []
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            if start:
+                # Waking thousands of writers at once starves other coroutines; yield between batches.
+                await asyncio.sleep(0)
+            for websocket, (queue, _) in connections[start:start + BROADCAST_BATCH_SIZE]:
+                try:
+                    queue.put_nowait(message)
+                except asyncio.QueueFull:
+                    logger.warning("WebSocket %s fell %d messages behind; dropping it", websocket.client, queue.maxsize)
+                    stalled.append(websocket)
+        if stalled:
+            await asyncio.gather(*(self._evict(websocket) for websocket in stalled))
 
     async def broadcast_job(self, job_payload: Dict) -> None:
         await self.broadcast({"type": "job", "data": job_payload})
+
+    async def broadcast_jobs(self, job_payloads: List[Dict]) -> None:
+        # A lone job keeps the legacy single-job frame so older dashboards still pick it up.
+        if len(job_payloads) == 1:
+            await self.broadcast_job(job_payloads[0])
+        elif job_payloads:
+            await self.broadcast({"type": "jobs", "data": job_payloads})
@@ -6,14 +6,17 @@ import os
 import random
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import httpx
+import orjson
 from dateutil import parser as date_parser
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from .database import SessionLocal
-from .models import Job, serialize_job
+from .models import Job, serialize_job_row
 from .notifier import Notifier
 
 logger = logging.getLogger(__name__)
@@ -31,35 +34,65 @@ US_HINTS = (
     "remote within the us",
     "remote in the us"
 )
-STATE_ABBREVIATIONS = {
+NON_US_REMOTE_HINTS = (
+    "canada", "emea", "europe", "apac", "asia", "uk", "ireland", "australia", "new zealand", "latam", "global", "worldwide"
+)
+STATE_ABBREVIATIONS = frozenset({
     "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC"
-}
-STATE_NAMES = {
+})
+STATE_NAMES = frozenset({
     "alabama", "alaska", "arizona", "arkansas", "california", "colorado", "connecticut", "delaware", "florida", "georgia", "hawaii", "idaho", "illinois", "indiana", "iowa", "kansas", "kentucky", "louisiana", "maine", "maryland", "massachusetts", "michigan", "minnesota", "mississippi", "missouri", "montana", "nebraska", "nevada", "new hampshire", "new jersey", "new mexico", "new york", "north carolina", "north dakota", "ohio", "oklahoma", "oregon", "pennsylvania", "rhode island", "south carolina", "south dakota", "tennessee", "texas", "utah", "vermont", "virginia", "washington", "west virginia", "wisconsin", "wyoming", "district of columbia"
-}
+})
+_LOC_SPLIT_RE = re.compile(r"[\/;|]")
+_PAREN_RE = re.compile(r"\([^)]*\)")
+_US_HINT_RE = re.compile("|".join(map(re.escape, US_HINTS)))
+_NON_US_REMOTE_HINT_RE = re.compile("|".join(map(re.escape, NON_US_REMOTE_HINTS)))
 DEFAULT_GREENHOUSE_BOARDS = [slug for slug in os.getenv("GREENHOUSE_BOARDS", "airbnb,databricks").split(",") if slug.strip()]
 DEFAULT_LEVER_COMPANIES = [slug for slug in os.getenv("LEVER_COMPANIES", "lever").split(",") if slug.strip()]
 DEFAULT_ASHBY_ORGS = [slug for slug in os.getenv("ASHBY_ORGANIZATIONS", "").split(",") if slug.strip()]
 DEFAULT_SMARTRECRUITERS_COMPANIES = [slug for slug in os.getenv("SMARTRECRUITERS_COMPANIES", "smartrecruiters").split(",") if slug.strip()]
 DEFAULT_RECRUITEE_COMPANIES = [slug for slug in os.getenv("RECRUITEE_COMPANIES", "").split(",") if slug.strip()]
 
+ASHBY_JOB_BOARD_QUERY = (
+    "query JobBoardWithTeams($organizationHostedJobsPageName: String!) { "
+    "jobBoardWithTeams(organizationHostedJobsPageName: $organizationHostedJobsPageName) { "
+    "jobPostings { id title locationName employmentType teamId } "
+    "teams { id name } "
+    "} }"
+)
+
 POLL_MIN_SECONDS = int(os.getenv("POLL_INTERVAL_MIN_SECONDS", "120"))
 POLL_MAX_SECONDS = int(os.getenv("POLL_INTERVAL_MAX_SECONDS", "300"))
+FETCH_CONCURRENCY = max(1, int(os.getenv("POLL_FETCH_CONCURRENCY", "16")))
+SMARTRECRUITERS_DETAIL_CONCURRENCY = 8
+# Rows per INSERT / keys per lookup; 7 columns x 1000 rows stays well under asyncpg's 32767-parameter cap.
+PERSIST_BATCH_SIZE = 1000
+
+_http_client: Optional[httpx.AsyncClient] = None
+# (ETag, Last-Modified) per board URL, used to skip re-downloading unchanged boards.
+Validators = Dict[str, Tuple[Optional[str], Optional[str]]]
+_board_validators: Validators = {}
 
 
+@lru_cache(maxsize=2048)
 def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
     try:
-        dt = date_parser.parse(value)
-    except (ValueError, TypeError) as exc:  # pragma: no cover - defensive parsing
-        logger.debug("Unable to parse datetime %s: %s", value, exc)
-        return None
+        # Providers emit ISO-8601, so try the C parser before dateutil's general one.
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        try:
+            dt = date_parser.parse(value)
+        except (ValueError, TypeError) as exc:  # pragma: no cover - defensive parsing
+            logger.debug("Unable to parse datetime %s: %s", value, exc)
+            return None
     if dt.tzinfo is None:
         return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
+@lru_cache(maxsize=4096)
 def _is_internship(title: Optional[str]) -> bool:
     if not title:
         return False
@@ -69,32 +102,29 @@ def _is_internship(title: Optional[str]) -> bool:
 
 
 
+@lru_cache(maxsize=4096)
 def _is_us_location(location: Optional[str]) -> bool:
     if not location:
         return False
     normalized = location.lower()
-    if any(hint in normalized for hint in US_HINTS):
+    if _US_HINT_RE.search(normalized) is not None:
         return True
     if 'remote' in normalized:
-        non_us_remote_hints = (
-            'canada', 'emea', 'europe', 'apac', 'asia', 'uk', 'ireland', 'australia', 'new zealand', 'latam', 'global', 'worldwide'
-        )
-        if not any(hint in normalized for hint in non_us_remote_hints):
+        if _NON_US_REMOTE_HINT_RE.search(normalized) is None:
             return True
-    tokens = re.split(r"[\/;|]", location)
+    tokens = _LOC_SPLIT_RE.split(location)
     for token in tokens:
         parts = [part.strip() for part in token.split(',')]
         if not parts:
             continue
         for part in reversed(parts):
-            candidate = re.sub(r"\([^)]*\)", "", part).strip()
+            candidate = _PAREN_RE.sub("", part).strip()
             if not candidate:
                 continue
-            lower = candidate.lower()
-            upper = candidate.upper()
-            if lower in STATE_NAMES:
+            # Abbreviations are exactly two letters and the shortest state names have four.
+            if len(candidate) == 2 and candidate.upper() in STATE_ABBREVIATIONS:
                 return True
-            if upper in STATE_ABBREVIATIONS:
+            if len(candidate) >= 4 and candidate.lower() in STATE_NAMES:
                 return True
     return False
 
@@ -106,10 +136,80 @@ def _clamp_sleep_window() -> int:
     return random.randint(low, high)
 
 
+def _get_http_client() -> httpx.AsyncClient:
+    # One long-lived client so keep-alive and HTTP/2 connections survive between poll cycles.
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(20.0, read=20.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def _conditional_get(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    validators: Optional[Validators] = None,
+) -> Optional[httpx.Response]:
+    """GET ``url`` with the validators from the last stored poll; returns None on 304 Not Modified.
+
+    Fresh validators are staged in ``validators`` for the caller to promote once the payload is stored.
+    """
+    request = client.build_request("GET", url, params=params)
+    cache_key = str(request.url)
+    etag, last_modified = _board_validators.get(cache_key, (None, None))
+    if etag:
+        request.headers["If-None-Match"] = etag
+    if last_modified:
+        request.headers["If-Modified-Since"] = last_modified
+    response = await client.send(request)
+    if response.status_code == 304:
+        return None
+    if response.is_success and validators is not None:
+        validators[cache_key] = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return response
+
+
+def _clean_slugs(slugs: Iterable[str]) -> List[str]:
+    return [slug for slug in (raw.strip() for raw in slugs) if slug]
+
+
+async def _gather_slugs(
+    provider: str,
+    slugs: List[str],
+    fetch_one: Callable[[str], Awaitable[List[Dict[str, Any]]]],
+) -> List[Dict[str, Any]]:
+    # Boards are fetched concurrently, bounded so a long slug list doesn't exhaust the client pool.
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def run(slug: str) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return await fetch_one(slug)
+
+    batches = await asyncio.gather(*(run(slug) for slug in slugs), return_exceptions=True)
+    results: List[Dict[str, Any]] = []
+    for slug, batch in zip(slugs, batches):
+        if isinstance(batch, BaseException):
+            logger.warning("%s fetch failed for %s: %s", provider, slug, batch)
+            continue
+        results.extend(batch)
+    return results
+
+
 def _safe_json(response: httpx.Response, context: str) -> Optional[Any]:
     try:
-        return response.json()
-    except ValueError as exc:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as exc:
         logger.warning("%s returned invalid JSON: %s", context, exc)
         return None
 
@@ -132,337 +232,428 @@ async def start_poller(notifier: Notifier) -> None:
 
 
 async def poll_once(notifier: Notifier) -> List[Dict[str, Any]]:
-    async with httpx.AsyncClient(timeout=httpx.Timeout(20.0, read=20.0)) as client:
-        harvested: List[Dict[str, Any]] = []
-        harvested.extend(await fetch_greenhouse_jobs(client, DEFAULT_GREENHOUSE_BOARDS))
-        harvested.extend(await fetch_lever_jobs(client, DEFAULT_LEVER_COMPANIES))
-        harvested.extend(await fetch_ashby_jobs(client, DEFAULT_ASHBY_ORGS))
-        harvested.extend(await fetch_smartrecruiters_jobs(client, DEFAULT_SMARTRECRUITERS_COMPANIES))
-        harvested.extend(await fetch_recruitee_jobs(client, DEFAULT_RECRUITEE_COMPANIES))
-
-    if not harvested:
-        return []
+    client = _get_http_client()
+    # Scoped to this poll so a failed write, or a concurrent /poll, can't promote validators it didn't store.
+    pending_validators: Validators = {}
+    sources = ("Greenhouse", "Lever", "Ashby", "SmartRecruiters", "Recruitee")
+    results = await asyncio.gather(
+        fetch_greenhouse_jobs(client, DEFAULT_GREENHOUSE_BOARDS, validators=pending_validators),
+        fetch_lever_jobs(client, DEFAULT_LEVER_COMPANIES, validators=pending_validators),
+        fetch_ashby_jobs(client, DEFAULT_ASHBY_ORGS),
+        fetch_smartrecruiters_jobs(client, DEFAULT_SMARTRECRUITERS_COMPANIES, validators=pending_validators),
+        fetch_recruitee_jobs(client, DEFAULT_RECRUITEE_COMPANIES, validators=pending_validators),
+        return_exceptions=True,
+    )
 
-    new_jobs = await asyncio.to_thread(_persist_jobs, harvested)
+    harvested: List[Dict[str, Any]] = []
+    for source, result in zip(sources, results):
+        if isinstance(result, BaseException):
+            logger.warning("%s fetch failed: %s", source, result)
+            continue
+        harvested.extend(result)
+
+    new_jobs = await _persist_jobs(harvested) if harvested else []
+    # Validators are only trusted once their payloads are stored; if persisting raises they are dropped
+    # with this call, so those boards are downloaded in full next poll.
+    _board_validators.update(pending_validators)
 
-    for job in new_jobs:
-        await notifier.broadcast_job(job)
+    if new_jobs:
+        await notifier.broadcast_jobs(new_jobs)
 
     return new_jobs
 
 
 
-async def fetch_greenhouse_jobs(client: httpx.AsyncClient, boards: Iterable[str]) -> List[Dict[str, Any]]:
+async def fetch_greenhouse_jobs(
+    client: httpx.AsyncClient, boards: Iterable[str], *, validators: Optional[Validators] = None
+) -> List[Dict[str, Any]]:
+    slugs = _clean_slugs(boards)
+    if not slugs:
+        return []
+    return await _gather_slugs("Greenhouse", slugs, lambda board: _fetch_greenhouse_board(client, board, validators))
+
+
+async def _fetch_greenhouse_board(
+    client: httpx.AsyncClient, board_slug: str, validators: Optional[Validators]
+) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-    for board in boards:
-        board_slug = board.strip()
-        if not board_slug:
-            continue
-        url = f"https://boards-api.greenhouse.io/v1/boards/{board_slug}/jobs?content=true"
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-        except Exception as exc:
-            logger.warning("Greenhouse request failed for %s: %s", board_slug, exc)
+    url = f"https://boards-api.greenhouse.io/v1/boards/{board_slug}/jobs?content=true"
+    try:
+        response = await _conditional_get(client, url, validators=validators)
+        if response is None:
+            return results
+        response.raise_for_status()
+    except Exception as exc:
+        logger.warning("Greenhouse request failed for %s: %s", board_slug, exc)
+        return results
+    payload = _safe_json(response, f"Greenhouse {board_slug}")
+    if not isinstance(payload, dict):
+        return results
+    jobs = payload.get("jobs", [])
+    for job in jobs:
+        title = job.get("title")
+        if not _is_internship(title):
             continue
-        payload = _safe_json(response, f"Greenhouse {board_slug}")
-        if not isinstance(payload, dict):
+        location = (job.get("location") or {}).get("name")
+        if location and not _is_us_location(location):
+            offices = job.get("offices") or []
+            office_names = ", ".join(
+                filter(None, [office.get("name") for office in offices if isinstance(office, dict)])
+            )
+            if office_names:
+                location = office_names
+        if not _is_us_location(location):
             continue
-        jobs = payload.get("jobs", [])
-        for job in jobs:
-            title = job.get("title")
-            if not _is_internship(title):
-                continue
-            location = (job.get("location") or {}).get("name")
-            if location and not _is_us_location(location):
-                offices = job.get("offices") or []
-                office_names = ", ".join(
-                    filter(None, [office.get("name") for office in offices if isinstance(office, dict)])
-                )
-                if office_names:
-                    location = office_names
-            if not _is_us_location(location):
-                continue
-            normalized = {
-                "title": title,
-                "company": job.get("company_name") or board_slug.capitalize(),
-                "location": location,
-                "url": job.get("absolute_url"),
-                "posted_at": _parse_datetime(job.get("updated_at") or job.get("first_published")),
-                "req_id": str(job.get("id")),
-                "source": "greenhouse",
-            }
-            if normalized["url"]:
-                results.append(normalized)
+        normalized = {
+            "title": title,
+            "company": job.get("company_name") or board_slug.capitalize(),
+            "location": location,
+            "url": job.get("absolute_url"),
+            "posted_at": _parse_datetime(job.get("updated_at") or job.get("first_published")),
+            "req_id": str(job.get("id")),
+            "source": "greenhouse",
+        }
+        if normalized["url"]:
+            results.append(normalized)
     return results
 
 
 
 
 
-async def fetch_lever_jobs(client: httpx.AsyncClient, companies: Iterable[str]) -> List[Dict[str, Any]]:
+async def fetch_lever_jobs(
+    client: httpx.AsyncClient, companies: Iterable[str], *, validators: Optional[Validators] = None
+) -> List[Dict[str, Any]]:
+    slugs = _clean_slugs(companies)
+    if not slugs:
+        return []
+    return await _gather_slugs("Lever", slugs, lambda slug: _fetch_lever_company(client, slug, validators))
+
+
+async def _fetch_lever_company(
+    client: httpx.AsyncClient, slug: str, validators: Optional[Validators]
+) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-    for company in companies:
-        slug = company.strip()
-        if not slug:
-            continue
-        url = f"https://api.lever.co/v0/postings/{slug}?mode=json"
-        try:
-            response = await client.get(url)
-            if response.status_code == 404:
-                logger.debug("Lever company %s not found", slug)
-                continue
-            response.raise_for_status()
-        except Exception as exc:
-            logger.warning("Lever request failed for %s: %s", slug, exc)
+    url = f"https://api.lever.co/v0/postings/{slug}?mode=json"
+    try:
+        response = await _conditional_get(client, url, validators=validators)
+        if response is None:
+            return results
+        if response.status_code == 404:
+            logger.debug("Lever company %s not found", slug)
+            return results
+        response.raise_for_status()
+    except Exception as exc:
+        logger.warning("Lever request failed for %s: %s", slug, exc)
+        return results
+    payload = _safe_json(response, f"Lever {slug}")
+    if isinstance(payload, dict) and not payload.get("ok", True):
+        logger.debug("Lever API responded with error for %s: %s", slug, payload)
+        return results
+    postings = payload if isinstance(payload, list) else []
+    for posting in postings:
+        title = posting.get("text") or posting.get("title")
+        if not _is_internship(title):
             continue
-        payload = _safe_json(response, f"Lever {slug}")
-        if isinstance(payload, dict) and not payload.get("ok", True):
-            logger.debug("Lever API responded with error for %s: %s", slug, payload)
+        categories = posting.get("categories") or {}
+        location = categories.get("location")
+        if not location:
+            all_locations = categories.get("allLocations")
+            if isinstance(all_locations, list) and all_locations:
+                location = ", ".join(all_locations)
+        loc_obj = posting.get("location")
+        if not location and isinstance(loc_obj, dict):
+            location_parts = [loc_obj.get("city"), loc_obj.get("state"), loc_obj.get("country")]
+            location = ", ".join(filter(None, location_parts)) or None
+        if isinstance(loc_obj, str) and not location:
+            location = loc_obj
+        if not location and categories.get("country") in {"United States", "USA"}:
+            location = categories.get("country")
+        if not _is_us_location(location):
             continue
-        postings = payload if isinstance(payload, list) else []
-        for posting in postings:
-            title = posting.get("text") or posting.get("title")
-            if not _is_internship(title):
-                continue
-            categories = posting.get("categories") or {}
-            location = categories.get("location")
-            if not location:
-                all_locations = categories.get("allLocations")
-                if isinstance(all_locations, list) and all_locations:
-                    location = ", ".join(all_locations)
-            loc_obj = posting.get("location")
-            if not location and isinstance(loc_obj, dict):
-                location_parts = [loc_obj.get("city"), loc_obj.get("state"), loc_obj.get("country")]
-                location = ", ".join(filter(None, location_parts)) or None
-            if isinstance(loc_obj, str) and not location:
-                location = loc_obj
-            if not location and categories.get("country") in {"United States", "USA"}:
-                location = categories.get("country")
-            if not _is_us_location(location):
-                continue
-            normalized = {
-                "title": title,
-                "company": posting.get("company") or slug.capitalize(),
-                "location": location,
-                "url": posting.get("hostedUrl") or posting.get("applyUrl"),
-                "posted_at": _parse_datetime(posting.get("createdAt")),
-                "req_id": posting.get("id") or posting.get("leverId") or posting.get("postingId"),
-                "source": "lever",
-            }
-            if normalized["url"] and normalized["req_id"]:
-                results.append(normalized)
+        normalized = {
+            "title": title,
+            "company": posting.get("company") or slug.capitalize(),
+            "location": location,
+            "url": posting.get("hostedUrl") or posting.get("applyUrl"),
+            "posted_at": _parse_datetime(posting.get("createdAt")),
+            "req_id": posting.get("id") or posting.get("leverId") or posting.get("postingId"),
+            "source": "lever",
+        }
+        if normalized["url"] and normalized["req_id"]:
+            results.append(normalized)
     return results
 
 
 
 async def fetch_ashby_jobs(client: httpx.AsyncClient, org_slugs: Iterable[str]) -> List[Dict[str, Any]]:
+    slugs = _clean_slugs(org_slugs)
+    if not slugs:
+        return []
+    return await _gather_slugs("Ashby", slugs, lambda slug: _fetch_ashby_org(client, slug))
+
+
+async def _fetch_ashby_org(client: httpx.AsyncClient, hosted_name: str) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-    if not org_slugs:
+    payload = {
+        "operationName": "JobBoardWithTeams",
+        "query": ASHBY_JOB_BOARD_QUERY,
+        "variables": {"organizationHostedJobsPageName": hosted_name},
+    }
+    try:
+        response = await client.post(
+            "https://jobs.ashbyhq.com/api/non-user-graphql",
+            json=payload,
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+    except Exception as exc:
+        logger.warning("Ashby request failed for %s: %s", hosted_name, exc)
         return results
-    query = (
-        "query JobBoardWithTeams($organizationHostedJobsPageName: String!) { "
-        "jobBoardWithTeams(organizationHostedJobsPageName: $organizationHostedJobsPageName) { "
-        "jobPostings { id title locationName employmentType teamId } "
-        "teams { id name } "
-        "} }"
-    )
-    for slug in org_slugs:
-        hosted_name = slug.strip()
-        if not hosted_name:
-            continue
-        payload = {
-            "operationName": "JobBoardWithTeams",
-            "query": query,
-            "variables": {"organizationHostedJobsPageName": hosted_name},
-        }
-        try:
-            response = await client.post(
-                "https://jobs.ashbyhq.com/api/non-user-graphql",
-                json=payload,
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
-        except Exception as exc:
-            logger.warning("Ashby request failed for %s: %s", hosted_name, exc)
+    payload_json = _safe_json(response, f"Ashby {hosted_name}")
+    if not isinstance(payload_json, dict):
+        return results
+    board = (payload_json.get("data") or {}).get("jobBoardWithTeams") or {}
+    postings = board.get("jobPostings") or []
+    teams = {team.get("id"): team.get("name") for team in board.get("teams") or []}
+    for posting in postings:
+        title = posting.get("title")
+        if not _is_internship(title):
             continue
-        payload_json = _safe_json(response, f"Ashby {hosted_name}")
-        if not isinstance(payload_json, dict):
+        team_name = teams.get(posting.get("teamId")) if posting.get("teamId") else None
+        location = posting.get("locationName") or posting.get("locationAddress")
+        if not _is_us_location(location):
             continue
-        board = (payload_json.get("data") or {}).get("jobBoardWithTeams") or {}
-        postings = board.get("jobPostings") or []
-        teams = {team.get("id"): team.get("name") for team in board.get("teams") or []}
-        for posting in postings:
-            title = posting.get("title")
-            if not _is_internship(title):
-                continue
-            team_name = teams.get(posting.get("teamId")) if posting.get("teamId") else None
-            location = posting.get("locationName") or posting.get("locationAddress")
-            if not _is_us_location(location):
-                continue
-            normalized = {
-                "title": title,
-                "company": team_name or hosted_name.capitalize(),
-                "location": location,
-                "url": f"https://jobs.ashbyhq.com/{hosted_name}/{posting.get('id')}",
-                "posted_at": None,  # Ashby board response does not include timestamps
-                "req_id": posting.get("id"),
-                "source": "ashby",
-            }
-            if normalized["req_id"]:
-                results.append(normalized)
+        normalized = {
+            "title": title,
+            "company": team_name or hosted_name.capitalize(),
+            "location": location,
+            "url": f"https://jobs.ashbyhq.com/{hosted_name}/{posting.get('id')}",
+            "posted_at": None,  # Ashby board response does not include timestamps
+            "req_id": posting.get("id"),
+            "source": "ashby",
+        }
+        if normalized["req_id"]:
+            results.append(normalized)
     return results
 
 
 
 
-async def fetch_smartrecruiters_jobs(client: httpx.AsyncClient, companies: Iterable[str]) -> List[Dict[str, Any]]:
+async def fetch_smartrecruiters_jobs(
+    client: httpx.AsyncClient, companies: Iterable[str], *, validators: Optional[Validators] = None
+) -> List[Dict[str, Any]]:
+    slugs = _clean_slugs(companies)
+    if not slugs:
+        return []
+    # Every detail URL lives on api.smartrecruiters.com, so the cap is shared by all companies in this poll.
+    detail_semaphore = asyncio.Semaphore(SMARTRECRUITERS_DETAIL_CONCURRENCY)
+    return await _gather_slugs(
+        "SmartRecruiters", slugs, lambda slug: _fetch_smartrecruiters_company(client, slug, detail_semaphore, validators)
+    )
+
+
+async def _fetch_smartrecruiters_company(
+    client: httpx.AsyncClient,
+    slug: str,
+    detail_semaphore: asyncio.Semaphore,
+    validators: Optional[Validators],
+) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-    for company in companies:
-        slug = company.strip()
-        if not slug:
-            continue
-        list_url = f"https://api.smartrecruiters.com/v1/companies/{slug}/postings"
-        try:
-            response = await client.get(list_url, params={"limit": 100})
-            response.raise_for_status()
-        except Exception as exc:
-            logger.warning("SmartRecruiters list request failed for %s: %s", slug, exc)
+    list_url = f"https://api.smartrecruiters.com/v1/companies/{slug}/postings"
+    try:
+        response = await _conditional_get(client, list_url, params={"limit": 100}, validators=validators)
+        if response is None:
+            return results
+        response.raise_for_status()
+    except Exception as exc:
+        logger.warning("SmartRecruiters list request failed for %s: %s", slug, exc)
+        return results
+    payload = _safe_json(response, f"SmartRecruiters {slug}")
+    if not isinstance(payload, dict):
+        return results
+    pending: List[Dict[str, Any]] = []
+    for posting in payload.get("content", []):
+        title = posting.get("name")
+        if not _is_internship(title):
             continue
-        payload = _safe_json(response, f"SmartRecruiters {slug}")
-        if not isinstance(payload, dict):
+        posting_id = posting.get("id")
+        location_data = posting.get("location") or {}
+        location = location_data.get("fullLocation") or location_data.get("city")
+        country_code = (location_data.get("country") or location_data.get("countryCode") or "").lower()
+        if not location and country_code in {"us", "usa"}:
+            location = "United States"
+        if location and not _is_us_location(location):
+            if country_code in {"us", "usa"} and "united states" not in location.lower():
+                location = f"{location}, United States"
+            else:
+                location = None
+        if not location or not _is_us_location(location):
             continue
-        for posting in payload.get("content", []):
-            title = posting.get("name")
-            if not _is_internship(title):
-                continue
-            posting_id = posting.get("id")
-            detail_url = posting.get("ref") or f"https://api.smartrecruiters.com/v1/companies/{slug}/postings/{posting_id}"
-            apply_url = None
-            posted_at = _parse_datetime(posting.get("releasedDate"))
-            location_data = posting.get("location") or {}
-            location = location_data.get("fullLocation") or location_data.get("city")
-            country_code = (location_data.get("country") or location_data.get("countryCode") or "").lower()
-            if not location and country_code in {"us", "usa"}:
-                location = "United States"
-            if location and not _is_us_location(location):
-                if country_code in {"us", "usa"} and "united states" not in location.lower():
-                    location = f"{location}, United States"
-                else:
-                    location = None
-            if not location or not _is_us_location(location):
-                continue
-            if detail_url:
-                try:
-                    detail = await client.get(detail_url)
-                    if detail.status_code == 200:
-                        detail_payload = _safe_json(detail, f"SmartRecruiters detail {posting_id}")
-                        if isinstance(detail_payload, dict):
-                            apply_url = (
-                                detail_payload.get("applyUrl")
-                                or (detail_payload.get("jobAd") or {}).get("applyUrl")
-                            )
-                except Exception as exc:
-                    logger.debug("SmartRecruiters detail fetch failed for %s: %s", posting_id, exc)
-            normalized = {
+        pending.append(
+            {
+                "posting": posting,
                 "title": title,
-                "company": (posting.get("company") or {}).get("name") or slug.capitalize(),
+                "posting_id": posting_id,
                 "location": location,
-                "url": apply_url or posting.get("ref") or posting.get("jobAdId"),
-                "posted_at": posted_at,
-                "req_id": posting_id,
-                "source": "smartrecruiters",
+                "detail_url": posting.get("ref") or f"https://api.smartrecruiters.com/v1/companies/{slug}/postings/{posting_id}",
             }
-            if normalized["url"] and normalized["req_id"]:
-                results.append(normalized)
+        )
+
+    async def fetch_detail(url: str) -> httpx.Response:
+        async with detail_semaphore:
+            return await client.get(url)
+
+    details = await asyncio.gather(*(fetch_detail(item["detail_url"]) for item in pending), return_exceptions=True)
+    for item, detail in zip(pending, details):
+        posting = item["posting"]
+        posting_id = item["posting_id"]
+        apply_url = None
+        if isinstance(detail, BaseException):
+            logger.debug("SmartRecruiters detail fetch failed for %s: %s", posting_id, detail)
+        elif detail.status_code == 200:
+            detail_payload = _safe_json(detail, f"SmartRecruiters detail {posting_id}")
+            if isinstance(detail_payload, dict):
+                apply_url = (
+                    detail_payload.get("applyUrl")
+                    or (detail_payload.get("jobAd") or {}).get("applyUrl")
+                )
+        normalized = {
+            "title": item["title"],
+            "company": (posting.get("company") or {}).get("name") or slug.capitalize(),
+            "location": item["location"],
+            "url": apply_url or posting.get("ref") or posting.get("jobAdId"),
+            "posted_at": _parse_datetime(posting.get("releasedDate")),
+            "req_id": posting_id,
+            "source": "smartrecruiters",
+        }
+        if normalized["url"] and normalized["req_id"]:
+            results.append(normalized)
     return results
 
 
 
 
 
-async def fetch_recruitee_jobs(client: httpx.AsyncClient, companies: Iterable[str]) -> List[Dict[str, Any]]:
+async def fetch_recruitee_jobs(
+    client: httpx.AsyncClient, companies: Iterable[str], *, validators: Optional[Validators] = None
+) -> List[Dict[str, Any]]:
+    slugs = _clean_slugs(companies)
+    if not slugs:
+        return []
+    return await _gather_slugs("Recruitee", slugs, lambda slug: _fetch_recruitee_company(client, slug, validators))
+
+
+async def _fetch_recruitee_company(
+    client: httpx.AsyncClient, slug: str, validators: Optional[Validators]
+) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-    for company in companies:
-        slug = company.strip()
-        if not slug:
-            continue
-        url = f"https://{slug}.recruitee.com/api/offers/"
-        try:
-            response = await client.get(url, params={"limit": 100})
-            response.raise_for_status()
-        except Exception as exc:
-            logger.warning("Recruitee request failed for %s: %s", slug, exc)
+    url = f"https://{slug}.recruitee.com/api/offers/"
+    try:
+        response = await _conditional_get(client, url, params={"limit": 100}, validators=validators)
+        if response is None:
+            return results
+        response.raise_for_status()
+    except Exception as exc:
+        logger.warning("Recruitee request failed for %s: %s", slug, exc)
+        return results
+    payload = _safe_json(response, f"Recruitee {slug}")
+    if not isinstance(payload, dict):
+        return results
+    offers = payload.get("offers") or []
+    for offer in offers:
+        title = offer.get("title")
+        if not _is_internship(title):
             continue
-        payload = _safe_json(response, f"Recruitee {slug}")
-        if not isinstance(payload, dict):
+        raw_location = offer.get("location")
+        location_label = offer.get("location_label")
+        country_code = ""
+        location = None
+        if isinstance(raw_location, dict):
+            country_code = (raw_location.get("country") or raw_location.get("country_code") or "").lower()
+            location_parts = [
+                raw_location.get("city"),
+                raw_location.get("region"),
+                raw_location.get("country"),
+            ]
+            location = ", ".join(filter(None, location_parts)) or location_label
+        elif isinstance(raw_location, str):
+            location = raw_location or location_label
+        else:
+            location = location_label
+        if country_code in {"us", "usa"}:
+            if location and "united states" not in location.lower():
+                location = f"{location}, United States"
+            elif not location:
+                location = "United States"
+        if not _is_us_location(location):
             continue
-        offers = payload.get("offers") or []
-        for offer in offers:
-            title = offer.get("title")
-            if not _is_internship(title):
-                continue
-            raw_location = offer.get("location")
-            location_label = offer.get("location_label")
-            country_code = ""
-            location = None
-            if isinstance(raw_location, dict):
-                country_code = (raw_location.get("country") or raw_location.get("country_code") or "").lower()
-                location_parts = [
-                    raw_location.get("city"),
-                    raw_location.get("region"),
-                    raw_location.get("country"),
-                ]
-                location = ", ".join(filter(None, location_parts)) or location_label
-            elif isinstance(raw_location, str):
-                location = raw_location or location_label
-            else:
-                location = location_label
-            if country_code in {"us", "usa"}:
-                if location and "united states" not in location.lower():
-                    location = f"{location}, United States"
-                elif not location:
-                    location = "United States"
-            if not _is_us_location(location):
-                continue
-            normalized = {
-                "title": title,
-                "company": offer.get("company_name") or slug.capitalize(),
-                "location": location,
-                "url": offer.get("careers_url") or offer.get("url"),
-                "posted_at": _parse_datetime(offer.get("published_at")),
-                "req_id": str(offer.get("id")),
-                "source": "recruitee",
-            }
-            if normalized["url"]:
-                results.append(normalized)
+        normalized = {
+            "title": title,
+            "company": offer.get("company_name") or slug.capitalize(),
+            "location": location,
+            "url": offer.get("careers_url") or offer.get("url"),
+            "posted_at": _parse_datetime(offer.get("published_at")),
+            "req_id": str(offer.get("id")),
+            "source": "recruitee",
+        }
+        if normalized["url"]:
+            results.append(normalized)
     return results
 
 
-def _persist_jobs(jobs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    session = SessionLocal()
-    inserted: List[Dict[str, Any]] = []
-    try:
-        for job in jobs:
-            if not job.get("req_id") or not job.get("url"):
-                continue
-            record = Job(
-                title=job["title"],
-                company=job.get("company") or "Unknown",
-                location=job.get("location"),
-                url=job["url"],
-                posted_at=job.get("posted_at"),
-                req_id=str(job["req_id"]),
-                source=job.get("source") or "unknown",
+async def _persist_jobs(jobs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for job in jobs:
+        if not job.get("req_id") or not job.get("url"):
+            continue
+        rows.append(
+            {
+                "title": job["title"],
+                "company": job.get("company") or "Unknown",
+                "location": job.get("location"),
+                "url": job["url"],
+                "posted_at": job.get("posted_at"),
+                "req_id": str(job["req_id"]),
+                "source": job.get("source") or "unknown",
+            }
+        )
+    if not rows:
+        return []
+
+    async with SessionLocal() as session:
+        # Steady-state polls are almost entirely repeats, so drop known keys with indexed lookups.
+        # Work in fixed-size batches: asyncpg rejects statements with more than 32767 bind parameters.
+        keys = list({(row["source"], row["req_id"]) for row in rows})
+        existing: Set[Tuple[str, str]] = set()
+        for start in range(0, len(keys), PERSIST_BATCH_SIZE):
+            batch = keys[start:start + PERSIST_BATCH_SIZE]
+            existing.update(
+                tuple(key)
+                for key in await session.execute(
+                    select(Job.source, Job.req_id).where(tuple_(Job.source, Job.req_id).in_(batch))
+                )
             )
-            session.add(record)
-            try:
-                session.commit()
-            except IntegrityError:
-                session.rollback()
-                continue
-            session.refresh(record)
-            inserted.append(serialize_job(record))
-    finally:
-        session.close()
+        rows = [row for row in rows if (row["source"], row["req_id"]) not in existing]
+        if not rows:
+            return []
+
+        # Duplicates (including repeats within the harvest) are skipped by the unique constraint.
+        pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for row in rows:
+            pending.setdefault((row["source"], row["req_id"]), row)
+        inserted: List[Dict[str, Any]] = []
+        for start in range(0, len(rows), PERSIST_BATCH_SIZE):
+            stmt = (
+                pg_insert(Job.__table__)
+                .values(rows[start:start + PERSIST_BATCH_SIZE])
+                .on_conflict_do_nothing(index_elements=["source", "req_id"])
+                .returning(Job.id, Job.created_at, Job.source, Job.req_id)
+            )
+            # Only server-generated columns come back; the rest is already in memory.
+            inserted.extend(
+                serialize_job_row({**pending[(stored.source, stored.req_id)], "id": stored.id, "created_at": stored.created_at})
+                for stored in await session.execute(stmt)
+            )
+        await session.commit()
     return inserted
@@ -99,6 +99,8 @@ function App() {
         const payload = JSON.parse(event.data);
         if (payload?.type === 'job' && payload?.data) {
           handleIncomingJob(payload.data as Job);
+        } else if (payload?.type === 'jobs' && Array.isArray(payload?.data)) {
+          (payload.data as Job[]).forEach(handleIncomingJob);
         }
       } catch (err) {
         console.error('Unable to parse websocket message', err);